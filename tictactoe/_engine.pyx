@@ -0,0 +1,119 @@
+# cython: language_level=3
+"""Compiled minimax for the Tic Tac Toe AI.
+
+Optional: build in place with ``python setup.py build_ext --inplace`` from
+this directory.  ``main.py`` falls back to its pure-Python search when the
+extension is missing.
+"""
+cimport cython
+
+cdef enum:
+    EMPTY = 0
+    X = 1
+    O = 2
+
+cdef int MOVE_ORDER[9]
+MOVE_ORDER[:] = [4, 0, 2, 6, 8, 1, 3, 5, 7]
+
+
+# The (at most 4) winning lines through each cell, padded with -1.
+cdef int LINES_THROUGH[9][4][3]
+cdef int _cell, _n, _k
+_LINES = ((0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6),
+          (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6))
+for _cell in range(9):
+    _n = 0
+    for _line in _LINES:
+        if _cell in _line:
+            for _k in range(3):
+                LINES_THROUGH[_cell][_n][_k] = _line[_k]
+            _n += 1
+    while _n < 4:
+        LINES_THROUGH[_cell][_n][0] = -1
+        _n += 1
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline bint completes_line(int* b, int last) noexcept nogil:
+    """Return whether the token just placed on *last* completed a line."""
+    cdef int n
+    cdef int p = b[last]
+    for n in range(4):
+        if LINES_THROUGH[last][n][0] < 0:
+            break
+        if (b[LINES_THROUGH[last][n][0]] == p
+                and b[LINES_THROUGH[last][n][1]] == p
+                and b[LINES_THROUGH[last][n][2]] == p):
+            return True
+    return False
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+cdef int minimax(int* b, int depth, int is_max, int last, int filled,
+                 int alpha, int beta) noexcept nogil:
+    if completes_line(b, last):
+        return depth - 10 if is_max else 10 - depth
+    if filled == 9:
+        return 0
+
+    cdef int k, i, val
+    cdef int best = -100 if is_max else 100
+    for k in range(9):
+        i = MOVE_ORDER[k]
+        if b[i] != EMPTY:
+            continue
+        b[i] = O if is_max else X
+        val = minimax(b, depth + 1, not is_max, i, filled + 1, alpha, beta)
+        b[i] = EMPTY
+        if is_max:
+            if val > best:
+                best = val
+            if val > alpha:
+                alpha = val
+        else:
+            if val < best:
+                best = val
+            if val < beta:
+                beta = val
+        if beta <= alpha:
+            break
+        # Stop once the mover has found the best score still reachable.
+        if (best >= 9 - depth) if is_max else (best <= depth - 9):
+            break
+    return best
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def find_best_move(const unsigned char[::1] cells):
+    """Return the index of the best move for O, or *None* if board is full.
+
+    *cells* is any 9-byte buffer (e.g. a ``bytearray``) holding 0 = empty,
+    1 = X, 2 = O, so no per-cell Python objects are touched.
+    """
+    cdef int board[9]
+    cdef int k, i, score
+    cdef int best_score = -100
+    cdef int best_move = -1
+    cdef int filled = 0
+    for i in range(9):
+        board[i] = cells[i]
+        filled += board[i] != EMPTY
+
+    with nogil:
+        for k in range(9):
+            i = MOVE_ORDER[k]
+            if board[i] != EMPTY:
+                continue
+            board[i] = O
+            score = minimax(board, 0, 0, i, filled + 1, best_score, 100)
+            board[i] = EMPTY
+            if score > best_score:
+                best_score = score
+                best_move = i
+                if best_score >= 10:
+                    break
+    return None if best_move < 0 else best_move
@@ -0,0 +1,109 @@
+"""Numba-compiled minimax for the Tic Tac Toe AI.
+
+A zero-build alternative to the Cython engine in ``_engine.pyx``: needs
+``numpy`` and ``numba`` installed, but nothing compiled ahead of time.
+Cells are ``int8`` values: 0 = empty, 1 = X, 2 = O.
+"""
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+EMPTY, X, O = 0, 1, 2
+MOVE_ORDER = np.array((4, 0, 2, 6, 8, 1, 3, 5, 7), dtype=np.int64)
+
+
+def _lines_through() -> np.ndarray:
+    lines = ((0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6),
+             (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6))
+    table = np.full((9, 4, 3), -1, np.int8)
+    for cell in range(9):
+        through = [line for line in lines if cell in line]
+        table[cell, :len(through)] = through
+    return table
+
+
+# The (at most 4) winning lines through each cell, padded with -1.
+LINES_THROUGH = _lines_through()
+
+
+@njit(cache=True)
+def _completes_line(b: np.ndarray, last: int) -> bool:
+    p = b[last]
+    for n in range(4):
+        a, c, d = LINES_THROUGH[last, n]
+        if a < 0:
+            break
+        if b[a] == p and b[c] == p and b[d] == p:
+            return True
+    return False
+
+
+@njit("int64(int8[:], int64, boolean, int64, int64, int64, int64)", cache=True)
+def minimax_nb(
+    board: np.ndarray, depth: int, is_max: bool, last: int, filled: int, alpha: int, beta: int
+) -> int:
+    """Alpha-beta minimax on an ``int8[9]`` board.  Maximiser is O.
+
+    Only the lines through *last*, the cell just played, can have been
+    completed; *filled* counts occupied cells so a draw needs no scan.
+    """
+    if _completes_line(board, last):
+        return depth - 10 if is_max else 10 - depth
+    if filled == 9:
+        return 0
+
+    best = -100 if is_max else 100
+    for i in MOVE_ORDER:
+        if board[i] != EMPTY:
+            continue
+        board[i] = O if is_max else X
+        val = minimax_nb(board, depth + 1, not is_max, i, filled + 1, alpha, beta)
+        board[i] = EMPTY
+        if is_max:
+            best = max(best, val)
+            alpha = max(alpha, val)
+        else:
+            best = min(best, val)
+            beta = min(beta, val)
+        if beta <= alpha:
+            break
+        # Stop once the mover has found the best score still reachable.
+        if (best >= 9 - depth) if is_max else (best <= depth - 9):
+            break
+    return best
+
+
+@njit(cache=True)
+def _best_move_nb(board: np.ndarray) -> int:
+    best_score = -100
+    best_move = -1
+    filled = 0
+    for i in range(9):
+        if board[i] != EMPTY:
+            filled += 1
+    for i in MOVE_ORDER:
+        if board[i] != EMPTY:
+            continue
+        board[i] = O
+        score = minimax_nb(board, 0, False, i, filled + 1, best_score, 100)
+        board[i] = EMPTY
+        if score > best_score:
+            best_score = score
+            best_move = i
+            if best_score >= 10:
+                break
+    return best_move
+
+
+def find_best_move(cells: bytearray) -> int | None:
+    """Return the index of the best move for O, or *None* if board is full.
+
+    *cells* holds one byte per cell and is searched in place, without a copy.
+    """
+    move = _best_move_nb(np.frombuffer(cells, np.int8))
+    return None if move < 0 else int(move)
+
+
+# Pay the JIT compile at import rather than on the first AI turn.
+_best_move_nb(np.zeros(9, np.int8))
@@ -2,17 +2,21 @@
 """Tic Tac Toe — a polished PySide6 desktop game with an unbeatable AI."""
 from __future__ import annotations
 
+import json
 import logging
 import math
 import os
 import sys
+from array import array
+from functools import lru_cache, reduce
+from operator import or_
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from PySide6 import QtCore, QtWidgets
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +26,7 @@ logger = logging.getLogger(__name__)
 APP_TITLE = "Tic Tac Toe — PySide6"
 BOARD_SIZE = 3
 NUM_CELLS = BOARD_SIZE * BOARD_SIZE
+FULL_BOARD = (1 << NUM_CELLS) - 1
 
 WINNING_LINES: tuple[tuple[int, int, int], ...] = (
     (0, 1, 2), (3, 4, 5), (6, 7, 8),  # rows
@@ -29,9 +34,69 @@ WINNING_LINES: tuple[tuple[int, int, int], ...] = (
     (0, 4, 8), (2, 4, 6),             # diagonals
 )
 
-PLAYER_X = "X"
-PLAYER_O = "O"
-EMPTY = ""
+# Bit *i* of a bitboard is set when the player owns cell *i*.
+WIN_MASKS: tuple[int, ...] = tuple(
+    (1 << a) | (1 << b) | (1 << c) for a, b, c in WINNING_LINES
+)
+
+# Indexed by a bitboard: the union of every completed line it contains, or 0.
+# Turns winner detection into a single tuple lookup instead of a loop.
+_WIN_CELLS: tuple[int, ...] = tuple(
+    reduce(or_, (m for m in WIN_MASKS if (bb & m) == m), 0)
+    for bb in range(1 << NUM_CELLS)
+)
+
+
+def _rotate(perm: tuple[int, ...]) -> tuple[int, ...]:
+    return tuple(perm[(BOARD_SIZE - 1 - i % BOARD_SIZE) * BOARD_SIZE + i // BOARD_SIZE]
+                 for i in range(NUM_CELLS))
+
+
+def _mirror(perm: tuple[int, ...]) -> tuple[int, ...]:
+    return tuple(perm[i - i % BOARD_SIZE + BOARD_SIZE - 1 - i % BOARD_SIZE]
+                 for i in range(NUM_CELLS))
+
+
+def _dihedral() -> tuple[tuple[int, ...], ...]:
+    perms = [tuple(range(NUM_CELLS))]
+    for _ in range(3):
+        perms.append(_rotate(perms[-1]))
+    return tuple(perms + [_mirror(p) for p in perms])
+
+
+# The board's 8 symmetries (4 rotations x reflection) as index permutations:
+# cell *i* of the transformed board is cell ``perm[i]`` of the original.
+SYMMETRIES: tuple[tuple[int, ...], ...] = _dihedral()
+
+# One 512-entry table per symmetry mapping a bitboard to its transformed form.
+_SYM_TABLES: tuple[tuple[int, ...], ...] = tuple(
+    tuple(
+        reduce(or_, ((bb >> src & 1) << i for i, src in enumerate(perm)), 0)
+        for bb in range(1 << NUM_CELLS)
+    )
+    for perm in SYMMETRIES
+)
+
+# ``_SYM_INVERSE[s][i]`` is where cell *i* lands under ``SYMMETRIES[s]``.
+_SYM_INVERSE: tuple[tuple[int, ...], ...] = tuple(
+    tuple(perm.index(i) for i in range(NUM_CELLS)) for perm in SYMMETRIES
+)
+
+# Transposition-table bound flags for a stored minimax value.
+EXACT, LOWER_BOUND, UPPER_BOUND = range(3)
+
+# Canonical (x_bb, o_bb) -> (value, horizon searched, bound flag, best move).
+TranspositionTable = dict[tuple[int, int], tuple[int, int, int, int]]
+
+# Center first, then corners, then edges: strongest candidates are tried first.
+MOVE_ORDER: tuple[int, ...] = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+# Cells hold small ints (the same encoding the compiled engines use);
+# TOKENS maps them to the text shown on the buttons.
+EMPTY = 0
+PLAYER_X = 1
+PLAYER_O = 2
+TOKENS = ("", "X", "O")
 
 MIN_WINDOW_W = 560
 MIN_WINDOW_H = 640
@@ -44,91 +109,255 @@ ANIMATION_SHRINK_PX = 6
 
 WINNER_INLINE_STYLE = "font-weight: 900; color: #ffd35c; background: #1a3a2a;"
 
+# Precomputed {board_key: best_move} table, generated by ``precompute.py``.
+LUT_PATH = Path(__file__).resolve().parent / "minimax.json"
+QSS_PATH = Path(__file__).resolve().parent / "styles.qss"
+
 
 # ---------------------------------------------------------------------------
 # Game logic (pure functions — no UI coupling)
 # ---------------------------------------------------------------------------
-def check_winner(board: Sequence[str]) -> str | None:
-    """Return the winning player token, or *None* if no winner yet."""
+def to_bitboards(board: Sequence[int]) -> tuple[int, int]:
+    """Split a board into ``(x_bb, o_bb)`` 9-bit integer bitboards."""
+    x_bb = o_bb = 0
+    for i, cell in enumerate(board):
+        if cell == PLAYER_X:
+            x_bb |= 1 << i
+        elif cell == PLAYER_O:
+            o_bb |= 1 << i
+    return x_bb, o_bb
+
+
+def _to_bytes(board: Sequence[int]) -> bytearray:
+    """Copy *board* into a one-byte-per-cell buffer for the compiled engines."""
+    return bytearray(board)
+
+
+def _build_check_winner() -> Callable[[Sequence[int]], int | None]:
+    # Unroll WINNING_LINES into straight-line source: no loop, no tuple
+    # unpacking, just eight constant-index comparisons.
+    src = ["def check_winner(board):"]
     for a, b, c in WINNING_LINES:
-        if board[a] and board[a] == board[b] == board[c]:
-            return board[a]
-    return None
+        src.append(f"    if board[{a}] and board[{a}] == board[{b}] == board[{c}]:")
+        src.append(f"        return board[{a}]")
+    src.append("    return None")
+    namespace: dict[str, Callable[[Sequence[int]], int | None]] = {}
+    exec("\n".join(src), namespace)
+    func = namespace["check_winner"]
+    func.__doc__ = "Return the winning player, or *None* if no winner yet."
+    func.__module__ = __name__
+    return func
 
 
-def find_winning_cells(board: Sequence[str]) -> set[int]:
-    """Return the set of cell indices that form the winning line(s)."""
-    cells: set[int] = set()
-    for a, b, c in WINNING_LINES:
-        if board[a] and board[a] == board[b] == board[c]:
-            cells.update((a, b, c))
-    return cells
+check_winner = _build_check_winner()
+
+
+def is_draw(board: Sequence[int]) -> bool:
+    return EMPTY not in board and check_winner(board) is None
+
+
+def _canonical_with_symmetry(x_bb: int, o_bb: int) -> tuple[int, int, int]:
+    """Return the smallest of the board's 8 symmetric variants.
+
+    The third element is the index into ``SYMMETRIES`` that produces it.
+    """
+    return min((t[x_bb], t[o_bb], s) for s, t in enumerate(_SYM_TABLES))
 
 
-def is_draw(board: Sequence[str]) -> bool:
-    return all(board) and check_winner(board) is None
+def _ordered_moves(occupied: int, first: int | None) -> list[int]:
+    moves = [i for i in MOVE_ORDER if not occupied >> i & 1 and i != first]
+    if first is not None:
+        moves.insert(0, first)
+    return moves
 
 
 def minimax(
-    board: list[str],
+    x_bb: int,
+    o_bb: int,
     depth: int,
     is_maximizing: bool,
     alpha: float = -math.inf,
     beta: float = math.inf,
+    horizon: int = NUM_CELLS,
+    table: TranspositionTable | None = None,
 ) -> int:
-    """Minimax with alpha-beta pruning.  Maximiser is O, minimiser is X."""
-    winner = check_winner(board)
-    if winner == PLAYER_O:
+    """Fail-soft alpha-beta minimax.  Maximiser is O, minimiser is X.
+
+    The search stops *horizon* plies below this node, scoring unfinished
+    positions as 0.  *table* maps canonical boards onto
+    ``(value, horizon, flag, move)`` so iterative-deepening passes can
+    reuse each other's bounds and try the previous best move first.
+    """
+    # Only the player who just moved can have completed a line.
+    if is_maximizing:
+        if _WIN_CELLS[x_bb]:
+            return depth - 10
+    elif _WIN_CELLS[o_bb]:
         return 10 - depth
-    if winner == PLAYER_X:
-        return depth - 10
-    if all(board):
+    occupied = x_bb | o_bb
+    if occupied == FULL_BOARD or horizon == 0:
         return 0
-
+    if table is None:
+        table = {}
+
+    cx_bb, co_bb, sym = _canonical_with_symmetry(x_bb, o_bb)
+    entry = table.get((cx_bb, co_bb))
+    hint: int | None = None
+    if entry is not None:
+        value, searched, flag, move = entry
+        if searched >= horizon and (
+            flag == EXACT
+            or (flag == LOWER_BOUND and value >= beta)
+            or (flag == UPPER_BOUND and value <= alpha)
+        ):
+            return value
+        hint = SYMMETRIES[sym][move]
+
+    alpha_in, beta_in = alpha, beta
+    best_move = -1
     if is_maximizing:
         best = -math.inf
-        for i in range(NUM_CELLS):
-            if not board[i]:
-                board[i] = PLAYER_O
-                val = minimax(board, depth + 1, False, alpha, beta)
-                board[i] = EMPTY
-                best = max(best, val)
-                alpha = max(alpha, val)
-                if beta <= alpha:
-                    break
-        return int(best)
+        for i in _ordered_moves(occupied, hint):
+            val = minimax(x_bb, o_bb | 1 << i, depth + 1, False, alpha, beta, horizon - 1, table)
+            if val > best:
+                best, best_move = val, i
+            alpha = max(alpha, val)
+            if beta <= alpha or best >= 9 - depth:  # can't beat winning next ply
+                break
     else:
         best = math.inf
-        for i in range(NUM_CELLS):
-            if not board[i]:
-                board[i] = PLAYER_X
-                val = minimax(board, depth + 1, True, alpha, beta)
-                board[i] = EMPTY
-                best = min(best, val)
-                beta = min(beta, val)
-                if beta <= alpha:
-                    break
-        return int(best)
-
-
-def find_best_move(board: list[str]) -> int | None:
-    """Return the index of the best move for O, or *None* if board is full."""
+        for i in _ordered_moves(occupied, hint):
+            val = minimax(x_bb | 1 << i, o_bb, depth + 1, True, alpha, beta, horizon - 1, table)
+            if val < best:
+                best, best_move = val, i
+            beta = min(beta, val)
+            if beta <= alpha or best <= depth - 9:
+                break
+
+    if best <= alpha_in:
+        flag = UPPER_BOUND
+    elif best >= beta_in:
+        flag = LOWER_BOUND
+    else:
+        flag = EXACT
+    table[cx_bb, co_bb] = (int(best), horizon, flag, _SYM_INVERSE[sym][best_move])
+    return int(best)
+
+
+def _search_root(
+    x_bb: int, o_bb: int, horizon: int, table: TranspositionTable, first: int | None
+) -> int | None:
+    occupied = x_bb | o_bb
     best_score = -math.inf
     best_move: int | None = None
-    for i in range(NUM_CELLS):
-        if not board[i]:
-            board[i] = PLAYER_O
-            score = minimax(board, 0, False)
-            board[i] = EMPTY
-            if score > best_score:
-                best_score = score
-                best_move = i
+    for i in _ordered_moves(occupied, first):
+        score = minimax(x_bb, o_bb | 1 << i, 0, False, best_score, math.inf, horizon - 1, table)
+        if score > best_score:
+            best_score = score
+            best_move = i
+            if best_score >= 10:  # an immediate win can't be improved on
+                break
     return best_move
 
 
+def search_best_move(board: Sequence[int]) -> int | None:
+    """Search for the best move for O, or return *None* if board is full.
+
+    Iterative deepening: each pass searches one ply deeper, seeded by the
+    transposition table and best move left behind by the previous pass.
+    """
+    x_bb, o_bb = to_bitboards(board)
+    table: TranspositionTable = {}
+    best_move: int | None = None
+    for horizon in range(1, NUM_CELLS - bin(x_bb | o_bb).count("1") + 1):
+        best_move = _search_root(x_bb, o_bb, horizon, table, best_move)
+    return best_move
+
+
+def board_key(board: Sequence[int]) -> str:
+    """Return the lookup-table key for *board* (``.`` marks an empty cell)."""
+    return "".join(TOKENS[cell] or "." for cell in board)
+
+
+def _load_lut() -> dict[str, int]:
+    try:
+        return json.loads(LUT_PATH.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        logger.warning("Move table not found at %s — falling back to search", LUT_PATH)
+    except (OSError, ValueError):
+        logger.exception("Failed to load move table from %s", LUT_PATH)
+    return {}
+
+
+_LUT = _load_lut()
+
+
+@lru_cache(maxsize=None)
+def _native_engine() -> Callable[[bytearray], int | None] | None:
+    """Import a compiled search on first use, or return *None* if none loads.
+
+    Deferred because the move table answers every reachable position, and
+    the Numba engine JIT-compiles (seconds on a cold cache) when imported.
+    """
+    try:  # optional compiled engine, built in place by ``setup.py``
+        from _engine import find_best_move as engine
+    except ImportError:
+        pass
+    else:
+        return engine
+    try:  # optional JIT engine, needs numpy + numba but no build step
+        from _engine_numba import find_best_move as engine
+    except ImportError:
+        return None
+    except Exception:
+        logger.exception("Numba engine failed to compile — using the Python search")
+        return None
+    return engine
+
+
+def find_best_move(board: Sequence[int]) -> int | None:
+    """Return the index of the best move for O, or *None* if board is full.
+
+    Positions reachable with X moving first are answered from the
+    precomputed table; anything else falls back to a full search, using
+    the compiled engine when it has been built.
+    """
+    move = _LUT.get(board_key(board))
+    if move is not None:
+        return move
+    engine = _native_engine()
+    if engine is not None:
+        return engine(_to_bytes(board))
+    return search_best_move(board)
+
+
+def _compute_reply(x_index: int) -> int | None:
+    board = [EMPTY] * NUM_CELLS
+    board[x_index] = PLAYER_X
+    return find_best_move(board)
+
+
+# O's reply to each of X's nine possible opening moves, indexed by X's cell.
+_OPENING_REPLY: tuple[int | None, ...] = tuple(_compute_reply(i) for i in range(NUM_CELLS))
+
+
 # ---------------------------------------------------------------------------
 # UI
 # ---------------------------------------------------------------------------
+def _load_qss() -> str:
+    try:
+        return QSS_PATH.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        logger.warning("Stylesheet not found at %s — using defaults", QSS_PATH)
+    except OSError:
+        logger.exception("Failed to load stylesheet from %s", QSS_PATH)
+    return ""
+
+
+# Read once per process, however many windows are created.
+_QSS = _load_qss()
+
+
 class TicTacToeWindow(QtWidgets.QMainWindow):
     """Main window for the Tic Tac Toe application."""
 
@@ -149,11 +378,16 @@ class TicTacToeWindow(QtWidgets.QMainWindow):
 
         # -- cell buttons --
         self.cells: list[QtWidgets.QPushButton] = []
+        self._anims: list[QtCore.QPropertyAnimation] = []
         for i in range(NUM_CELLS):
             btn = QtWidgets.QPushButton(objectName="cell")
             btn.setFocusPolicy(QtCore.Qt.FocusPolicy.StrongFocus)
-            btn.clicked.connect(lambda _checked=False, idx=i: self._on_cell_clicked(idx))
+            btn.setProperty("cellIndex", i)
+            btn.clicked.connect(self._on_cell_clicked_sender)
             self.cells.append(btn)
+            anim = QtCore.QPropertyAnimation(btn, b"geometry", btn)
+            anim.setDuration(ANIMATION_DURATION_MS)
+            self._anims.append(anim)
             self.grid.addWidget(btn, i // BOARD_SIZE, i % BOARD_SIZE)
 
         # -- controls --
@@ -180,10 +414,11 @@ class TicTacToeWindow(QtWidgets.QMainWindow):
         layout.setContentsMargins(*(LAYOUT_MARGIN,) * 4)
 
         # -- game state --
-        self.board: list[str] = [EMPTY] * NUM_CELLS
+        self.board = array("b", [EMPTY] * NUM_CELLS)
         self.current = PLAYER_X
         self.vs_ai = True
         self.game_over = False
+        self._last_rendered: list[tuple[str, bool]] = []
 
         # -- stylesheet --
         self._load_stylesheet()
@@ -193,13 +428,8 @@ class TicTacToeWindow(QtWidgets.QMainWindow):
     # -- Stylesheet --------------------------------------------------------
 
     def _load_stylesheet(self) -> None:
-        qss_path = Path(__file__).resolve().parent / "styles.qss"
-        try:
-            self.setStyleSheet(qss_path.read_text(encoding="utf-8"))
-        except FileNotFoundError:
-            logger.warning("Stylesheet not found at %s — using defaults", qss_path)
-        except OSError:
-            logger.exception("Failed to load stylesheet from %s", qss_path)
+        if _QSS:
+            self.setStyleSheet(_QSS)
 
     # -- Mode toggle -------------------------------------------------------
 
@@ -209,6 +439,10 @@ class TicTacToeWindow(QtWidgets.QMainWindow):
 
     # -- Cell interaction --------------------------------------------------
 
+    def _on_cell_clicked_sender(self) -> None:
+        # One shared slot for all cells; the index lives on the button.
+        self._on_cell_clicked(self.sender().property("cellIndex"))
+
     def _on_cell_clicked(self, idx: int) -> None:
         if self.game_over or self.board[idx]:
             return
@@ -227,15 +461,14 @@ class TicTacToeWindow(QtWidgets.QMainWindow):
         if self.vs_ai and self.current == PLAYER_O:
             QtCore.QTimer.singleShot(AI_DELAY_MS, self._ai_move)
 
-    def _place_move(self, idx: int, player: str) -> None:
+    def _place_move(self, idx: int, player: int) -> None:
         self.board[idx] = player
-        btn = self.cells[idx]
-        btn.setText(player)
-        self._animate_reveal(btn)
+        self._animate_reveal(idx)
 
-    def _animate_reveal(self, btn: QtWidgets.QPushButton) -> None:
-        rect = btn.geometry()
-        anim = QtCore.QPropertyAnimation(btn, b"geometry", btn)
+    def _animate_reveal(self, idx: int) -> None:
+        anim = self._anims[idx]
+        anim.stop()
+        rect = self.cells[idx].geometry()
         anim.setStartValue(
             rect.adjusted(
                 ANIMATION_SHRINK_PX, ANIMATION_SHRINK_PX,
@@ -243,8 +476,7 @@ class TicTacToeWindow(QtWidgets.QMainWindow):
             )
         )
         anim.setEndValue(rect)
-        anim.setDuration(ANIMATION_DURATION_MS)
-        anim.start(QtCore.QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
+        anim.start()
 
     # -- Turn / status -----------------------------------------------------
 
@@ -253,49 +485,61 @@ class TicTacToeWindow(QtWidgets.QMainWindow):
         self._sync_ui()
 
     def _sync_ui(self) -> None:
-        for i, token in enumerate(self.board):
-            btn = self.cells[i]
-            btn.setText(token)
-            btn.setEnabled(not token and not self.game_over)
+        self._render_cells()
 
         if not self.game_over:
             if self.vs_ai:
                 label = "Your move" if self.current == PLAYER_X else "AI is thinking..."
             else:
-                label = f"Player {self.current}'s turn"
+                label = f"Player {TOKENS[self.current]}'s turn"
             self.status_label.setText(label)
 
         self.mode_btn.setText("Mode: Vs AI" if self.vs_ai else "Mode: PvP")
 
+    def _render_cells(self) -> None:
+        """Push the board onto the cell buttons, touching only changed cells."""
+        rendered = [(TOKENS[cell], not cell and not self.game_over) for cell in self.board]
+        for i, (token, enabled) in enumerate(rendered):
+            if self._last_rendered and self._last_rendered[i] == (token, enabled):
+                continue
+            btn = self.cells[i]
+            btn.setText(token)
+            btn.setEnabled(enabled)
+        self._last_rendered = rendered
+
     # -- Game end ----------------------------------------------------------
 
-    def _finish(self, winner: str | None) -> None:
+    def _finish(self, winner: int | None) -> None:
         self.game_over = True
 
         if winner:
             self.status_label.setText(
                 f"You {'win' if winner == PLAYER_X and self.vs_ai else 'lose'}"
                 if self.vs_ai
-                else f"Player {winner} wins!"
+                else f"Player {TOKENS[winner]} wins!"
             )
-            for i in find_winning_cells(self.board):
-                self.cells[i].setStyleSheet(WINNER_INLINE_STYLE)
+            x_bb, o_bb = to_bitboards(self.board)
+            mask = _WIN_CELLS[x_bb if winner == PLAYER_X else o_bb]
+            i = 0
+            while mask:
+                if mask & 1:
+                    self.cells[i].setStyleSheet(WINNER_INLINE_STYLE)
+                mask >>= 1
+                i += 1
         else:
             self.status_label.setText("Draw!")
 
-        for btn in self.cells:
-            btn.setEnabled(False)
+        self._render_cells()
 
     # -- Restart -----------------------------------------------------------
 
     def _restart_game(self) -> None:
-        self.board = [EMPTY] * NUM_CELLS
+        self.board = array("b", [EMPTY] * NUM_CELLS)
         self.current = PLAYER_X
         self.game_over = False
         for btn in self.cells:
-            btn.setText(EMPTY)
-            btn.setEnabled(True)
-            btn.setStyleSheet("")
+            if btn.styleSheet():
+                btn.setStyleSheet("")
         self._sync_ui()
 
     # -- AI ----------------------------------------------------------------
@@ -303,7 +547,10 @@ class TicTacToeWindow(QtWidgets.QMainWindow):
     def _ai_move(self) -> None:
         if self.game_over:
             return
-        move = find_best_move(self.board)
+        if self.board.count(PLAYER_X) == 1 and self.board.count(PLAYER_O) == 0:
+            move = _OPENING_REPLY[self.board.index(PLAYER_X)]
+        else:
+            move = find_best_move(self.board)
         if move is None:
             return
 
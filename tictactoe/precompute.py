@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Regenerate ``minimax.json``, the AI's precomputed move table.
+
+Run from the repository root after changing the search::
+
+    python -m tictactoe.precompute
+"""
+from __future__ import annotations
+
+import json
+
+from tictactoe.main import (
+    EMPTY,
+    LUT_PATH,
+    NUM_CELLS,
+    PLAYER_O,
+    PLAYER_X,
+    board_key,
+    check_winner,
+    search_best_move,
+)
+
+
+def build_table() -> dict[str, int]:
+    """Map every reachable board with O to move onto O's best reply."""
+    table: dict[str, int] = {}
+    seen: set[str] = set()
+    stack: list[tuple[list[int], int]] = [([EMPTY] * NUM_CELLS, PLAYER_X)]
+    while stack:
+        board, player = stack.pop()
+        key = board_key(board)
+        if key in seen or check_winner(board) or all(board):
+            continue
+        seen.add(key)
+        if player == PLAYER_O:
+            move = search_best_move(board)
+            if move is not None:
+                table[key] = move
+        nxt = PLAYER_O if player == PLAYER_X else PLAYER_X
+        for i in range(NUM_CELLS):
+            if not board[i]:
+                child = board.copy()
+                child[i] = player
+                stack.append((child, nxt))
+    return table
+
+
+def main() -> None:
+    table = build_table()
+    LUT_PATH.write_text(json.dumps(table, sort_keys=True, indent=0) + "\n", encoding="utf-8")
+    print(f"Wrote {len(table)} positions to {LUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+"""Build the optional compiled AI engine in place.
+
+    python -m pip install cython setuptools
+    python setup.py build_ext --inplace
+"""
+from Cython.Build import cythonize
+from setuptools import setup
+
+setup(
+    name="tictactoe-engine",
+    ext_modules=cythonize("_engine.pyx", language_level=3),
+)